@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Generate elegant PNG place‑name tags from a simple text specification and bundle
-all tags into a print‑ready PDF.
+Generate elegant place‑name tags from a simple text specification and bundle
+them into a print‑ready PDF, optionally also writing each tag as a PNG.
 
 Changes from original version
 -----------------------------
@@ -10,7 +10,11 @@ Changes from original version
   inside the printable area.
 * ➡Still supports two‑per‑row layout by default; customise with `--cols`,
   `--margin`, and `--page-size`.
+* Tags go straight from memory into the PDF as JPEGs; pass `--keep-pngs`
+  to also write the individual PNG files.
 * Dependencies: `pip install pillow reportlab`.
+* PDF tags are JPEG-encoded; make sure Pillow links libjpeg‑turbo (check with
+  `python -c "from PIL import features; print(features.check_feature('libjpeg_turbo'))"`).
 
 Typical usage
 -------------
@@ -24,16 +28,21 @@ python generate_nametags_pdf.py attendees.txt --flowers \
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import math
+import multiprocessing
+import os
 import random
-import re
+import string
 import unicodedata
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 
 from PIL import Image, ImageDraw, ImageFont  # type: ignore
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 # --------------------------------------------------
@@ -67,71 +76,93 @@ def parse_input(file_path: Path) -> List[Tuple[str, str]]:
     return results
 
 
+# Non-ASCII is stripped before translating, so only ASCII needs a mapping.
+_SAFE_CHARS = set(string.ascii_letters + string.digits + "_-")
+_FILENAME_TRANS = str.maketrans({chr(i): "_" for i in range(128) if chr(i) not in _SAFE_CHARS})
+
+
 def sanitize_filename(txt: str) -> str:
     safe = unicodedata.normalize("NFKD", txt).encode("ascii", "ignore").decode()
-    return re.sub(r"[^A-Za-z0-9_\-]", "_", safe)
+    return safe.translate(_FILENAME_TRANS)
 
 # --------------------------------------------------
 # Motif helpers (flowers / hearts / etc.)
 # --------------------------------------------------
 
-def draw_with_tilt(base_img: Image.Image, draw_fn, cx: int, cy: int, size: int, colour: str):
-    """Draw motif with random tilt and paste onto base image."""
-    tilt_angle = random.uniform(-30, 30)
-    bbox_size = size * 2
-    temp_img = Image.new("RGBA", (bbox_size, bbox_size), (0, 0, 0, 0))
-    temp_draw = ImageDraw.Draw(temp_img)
+def _rotate(points, cx: float, cy: float, cos_a: float, sin_a: float):
+    """Rotate a list of (x, y) vertices about (cx, cy)."""
+    return [
+        (cx + (x - cx) * cos_a - (y - cy) * sin_a,
+         cy + (x - cx) * sin_a + (y - cy) * cos_a)
+        for x, y in points
+    ]
+
+
+@functools.lru_cache(maxsize=64)
+def _unit_arc(a0: float, a1: float, n: int) -> Tuple[Tuple[float, float], ...]:
+    """(cos, sin) of `n` evenly spaced angles from a0 to a1 degrees."""
+    step = math.radians(a1 - a0) / (n - 1)
+    start = math.radians(a0)
+    return tuple((math.cos(start + i * step), math.sin(start + i * step)) for i in range(n))
 
-    draw_fn(temp_draw, bbox_size // 2, bbox_size // 2, size, colour)
 
-    rotated = temp_img.rotate(tilt_angle, resample=Image.BICUBIC, expand=True)
-    rx, ry = rotated.size
-    px, py = cx - rx // 2, cy - ry // 2
-    base_img.paste(rotated, (px, py), rotated)
+def _arc_poly(cx: float, cy: float, rx: float, ry: float, a0: float, a1: float, n: int = 32):
+    """Polygon approximating a pieslice from a0 to a1 degrees (centre first)."""
+    return [(cx, cy)] + [(cx + c * rx, cy + s * ry) for c, s in _unit_arc(a0, a1, n)]
 
 
-def draw_flower(draw: ImageDraw.ImageDraw, cx: int, cy: int, r: int, colour: str) -> None:
+def draw_with_tilt(draw: ImageDraw.ImageDraw, draw_fn, cx: int, cy: int, size: int, colour: str):
+    """Draw motif with a random tilt, rotating its vertices instead of the pixels."""
+    tilt = math.radians(random.uniform(-30, 30))
+    draw_fn(draw, cx, cy, size, colour, math.cos(tilt), math.sin(tilt))
+
+
+# Petal directions relative to the flower's base angle: (tip, left, right) × 5.
+_PETAL_OFFSETS = [math.radians(i * 72 + o) for i in range(5) for o in (0, -20, 20)]
+_PETAL_COS = tuple(math.cos(a) for a in _PETAL_OFFSETS)
+_PETAL_SIN = tuple(math.sin(a) for a in _PETAL_OFFSETS)
+
+
+def draw_flower(draw: ImageDraw.ImageDraw, cx: int, cy: int, r: int, colour: str,
+                cos_a: float = 1.0, sin_a: float = 0.0) -> None:
     """Draw a 5‑petal flower centred at (cx, cy) with outer radius r."""
-    mid_angle = random.uniform(0, 360)
+    mid_angle = math.radians(random.uniform(0, 360))
+    # Fold the tilt into the base angle via the angle-sum identities, then
+    # rotate the precomputed petal offsets by it.
+    cm, sm = math.cos(mid_angle), math.sin(mid_angle)
+    cm, sm = cm * cos_a - sm * sin_a, sm * cos_a + cm * sin_a
     half_w = r // 2
-    for i in range(5):
-        ang = math.radians(mid_angle + i * 72)
-        left  = math.radians(mid_angle + i * 72 - 20)
-        right = math.radians(mid_angle + i * 72 + 20)
-        tip_x = cx + math.cos(ang) * r
-        tip_y = cy + math.sin(ang) * r
-        bl_x  = cx + math.cos(left)  * half_w
-        bl_y  = cy + math.sin(left)  * half_w
-        br_x  = cx + math.cos(right) * half_w
-        br_y  = cy + math.sin(right) * half_w
-        draw.polygon([(cx, cy), (bl_x, bl_y), (tip_x, tip_y), (br_x, br_y)], fill=colour)
+    for k in range(0, 15, 3):
+        pts = []
+        for j, reach in ((k, r), (k + 1, half_w), (k + 2, half_w)):
+            c = _PETAL_COS[j] * cm - _PETAL_SIN[j] * sm
+            s = _PETAL_SIN[j] * cm + _PETAL_COS[j] * sm
+            pts.append((cx + c * reach, cy + s * reach))
+        tip, bl, br = pts
+        draw.polygon([(cx, cy), bl, tip, br], fill=colour)
     centre = r // 6
     draw.ellipse([(cx-centre, cy-centre), (cx+centre, cy+centre)], fill="white")
 
 
-def draw_heart(draw: ImageDraw.ImageDraw, cx: int, cy: int, r: int, colour: str) -> None:
+def draw_heart(draw: ImageDraw.ImageDraw, cx: int, cy: int, r: int, colour: str,
+               cos_a: float = 1.0, sin_a: float = 0.0) -> None:
     lobe_r = r * 0.3
     lobe_offset_x = r * 0.3
     lobe_offset_y = r * 0.05
-    left_box = [
-        (cx - lobe_offset_x - lobe_r, cy - lobe_offset_y - lobe_r),
-        (cx - lobe_offset_x + lobe_r, cy - lobe_offset_y + lobe_r),
-    ]
-    draw.pieslice(left_box, 180, 360, fill=colour)
-    right_box = [
-        (cx + lobe_offset_x - lobe_r, cy - lobe_offset_y - lobe_r),
-        (cx + lobe_offset_x + lobe_r, cy - lobe_offset_y + lobe_r),
-    ]
-    draw.pieslice(right_box, 180, 360, fill=colour)
+    left_lobe = _arc_poly(cx - lobe_offset_x, cy - lobe_offset_y, lobe_r, lobe_r, 180, 360, 16)
+    draw.polygon(_rotate(left_lobe, cx, cy, cos_a, sin_a), fill=colour)
+    right_lobe = _arc_poly(cx + lobe_offset_x, cy - lobe_offset_y, lobe_r, lobe_r, 180, 360, 16)
+    draw.polygon(_rotate(right_lobe, cx, cy, cos_a, sin_a), fill=colour)
     triangle = [
         (cx - r * 0.6, cy - r * 0.05),
         (cx + r * 0.6, cy - r * 0.05),
         (cx, cy + r),
     ]
-    draw.polygon(triangle, fill=colour)
+    draw.polygon(_rotate(triangle, cx, cy, cos_a, sin_a), fill=colour)
 
 
-def draw_wine_glass(draw: ImageDraw.ImageDraw, cx: int, cy: int, h: int, colour: str) -> None:
+def draw_wine_glass(draw: ImageDraw.ImageDraw, cx: int, cy: int, h: int, colour: str,
+                    cos_a: float = 1.0, sin_a: float = 0.0) -> None:
     bowl_height = int(h * 0.6)
     bowl_width = h // 2
     stem_height = int(h * 0.3)
@@ -144,23 +175,28 @@ def draw_wine_glass(draw: ImageDraw.ImageDraw, cx: int, cy: int, h: int, colour:
         (cx + bowl_width // 6, bowl_bottom_y),
         (cx - bowl_width // 6, bowl_bottom_y),
     ]
-    draw.polygon(bowl, fill=colour)
+    draw.polygon(_rotate(bowl, cx, cy, cos_a, sin_a), fill=colour)
     stem_top_y = bowl_bottom_y
     stem_bottom_y = stem_top_y + stem_height
     stem_width = h // 15
-    draw.rectangle(
-        [(cx - stem_width // 2, stem_top_y), (cx + stem_width // 2, stem_bottom_y)],
-        fill=colour
-    )
+    stem = [
+        (cx - stem_width // 2, stem_top_y),
+        (cx + stem_width // 2, stem_top_y),
+        (cx + stem_width // 2, stem_bottom_y),
+        (cx - stem_width // 2, stem_bottom_y),
+    ]
+    draw.polygon(_rotate(stem, cx, cy, cos_a, sin_a), fill=colour)
     base_top = stem_bottom_y
     base_height = h // 20
-    draw.ellipse(
-        [(cx - base_width // 3, base_top), (cx + base_width // 3, base_top + base_height)],
-        fill=colour
-    )
+    base_rx = base_width / 3
+    base_ry = base_height / 2
+    base_cy = base_top + base_ry
+    base = [(cx + c * base_rx, base_cy + s * base_ry) for c, s in _unit_arc(0, 336, 15)]
+    draw.polygon(_rotate(base, cx, cy, cos_a, sin_a), fill=colour)
 
 
-def draw_diamond(draw: ImageDraw.ImageDraw, cx: int, cy: int, r: int, colour: str) -> None:
+def draw_diamond(draw: ImageDraw.ImageDraw, cx: int, cy: int, r: int, colour: str,
+                 cos_a: float = 1.0, sin_a: float = 0.0) -> None:
     width = r * 1.6
     height = r * 1.6
     top_y = cy - height * 0.4
@@ -174,74 +210,90 @@ def draw_diamond(draw: ImageDraw.ImageDraw, cx: int, cy: int, r: int, colour: st
         (cx + width * 0.4, mid_y),
         (cx, bottom_y),
     ]
-    draw.polygon(points, fill=colour)
+    draw.polygon(_rotate(points, cx, cy, cos_a, sin_a), fill=colour)
 
 # --------------------------------------------------
 # Tag compositor
 # --------------------------------------------------
 
-def compose_tag(
-    name: str,
-    *,
-    font_path: str,
-    size: Tuple[int, int],
-    font_size: int | None = None,
-    random_bubbles: bool = False,
-    flowers: bool = False,
-    table_label: str = "",
-) -> Image.Image:
-    W, H = size
-    img = Image.new("RGB", size, "white")
+def _draw_border(d: ImageDraw.ImageDraw, W: int, H: int) -> None:
+    border = max(2, min(W, H)//25)
+    d.rectangle([(0,0), (W-1, H-1)], outline=BLACK, width=border)
+
+
+@functools.lru_cache(maxsize=4)
+def _background_template(W: int, H: int) -> Image.Image:
+    """Corner quarters and border shared by every tag of a given size."""
+    img = Image.new("RGB", (W, H), "white")
     d   = ImageDraw.Draw(img)
 
+    # Polygon approximations of the original pieslice boxes (cheaper to fill).
     R = min(W, H) // 2
-    d.pieslice([(-R, H-2*R), (R, H+R)],   90, 180, fill=PINK)        # bottom-left
-    d.pieslice([(W-R, -R),   (W+R, R)],  -90,   0, fill=GOLD)        # top-right
+    d.polygon(_arc_poly(0, H - R/2, R, 1.5*R,  90, 180), fill=PINK)        # bottom-left
+    d.polygon(_arc_poly(W, 0,       R, R,     -90,   0), fill=GOLD)        # top-right
 
     r_s = min(W, H) // 4
-    d.pieslice([(-r_s, -r_s), (r_s, r_s)],           180, 270, fill=FAINT_PINK)
-    d.pieslice([(W-r_s, -r_s), (W+r_s, r_s)],         270, 360, fill=FAINT_PINK)
-
-    if random_bubbles or flowers:
-        placed: List[Tuple[int, int, int]] = []
-        for _ in range(80):
-            retries = 50
-            while retries:
-                r = random.randint(min(W, H) // 30, min(W, H) // 15)
-                cx = random.randint(r, W - r)
-                cy = random.randint(r, H - r)
-                if all(math.hypot(cx - x, cy - y) >= r + pr for x, y, pr in placed):
-                    colour = random.choice(PASTELS)
-                    if random_bubbles:
-                        d.ellipse([(cx - r, cy - r), (cx + r, cy + r)], fill=colour)
-                    if flowers:
-                        motif = random.choice(("flower", "heart", "wine", "diamond"))
-                        if motif == "flower":
-                            draw_with_tilt(img, draw_flower, cx, cy, r, colour)
-                        elif motif == "heart":
-                            draw_with_tilt(img, draw_heart, cx, cy, r, colour)
-                        elif motif == "wine":
-                            draw_with_tilt(img, draw_wine_glass, cx, cy, r*2, colour)
-                        else:
-                            draw_with_tilt(img, draw_diamond, cx, cy, r, colour)
-                    placed.append((cx, cy, r))
-                    break
-                retries -= 1
+    d.polygon(_arc_poly(0, 0, r_s, r_s, 180, 270), fill=FAINT_PINK)
+    d.polygon(_arc_poly(W, 0, r_s, r_s, 270, 360), fill=FAINT_PINK)
 
-    border = max(2, min(W, H)//25)
-    d.rectangle([(0,0), (W-1, H-1)], outline=BLACK, width=border)
+    _draw_border(d, W, H)
+    return img
 
-    fs = font_size or int(H * 0.25)
+
+@functools.lru_cache(maxsize=32)
+def _load_font(font_path: str, size: int):
+    """Load a TrueType font once per (path, size); falls back to Pillow's default."""
     try:
-        font = ImageFont.truetype(font_path, fs)
-        small_font = ImageFont.truetype(font_path, int(fs * 0.7))
+        return ImageFont.truetype(font_path, size)
     except OSError:
         print(f"Font '{font_path}' not found; using default.")
-        font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_size(font, text: str) -> Tuple[int, int]:
+    """Width and height of `text`, measured once per (font, text)."""
+    b = font.getbbox(text)
+    return b[2]-b[0], b[3]-b[1]
+
+
+_NEIGHBOUR_CELLS = tuple((i, j) for i in (-1, 0, 1) for j in (-1, 0, 1))
+
+
+def _place_bubbles(W: int, H: int, count: int = 80, retries: int = 50) -> List[Tuple[int, int, int]]:
+    """Rejection-sample up to `count` non-overlapping circles as (cx, cy, r)."""
+    randint = random.randint
+    r_min, r_max = min(W, H) // 30, min(W, H) // 15
+    # Circles can only overlap if their centres are closer than 2*r_max, so with
+    # cells that wide a candidate need only be checked against its 3×3 block.
+    cell = max(1, 2 * r_max)
+    grid: Dict[Tuple[int, int], List[Tuple[int, int, int]]] = {}
+    placed: List[Tuple[int, int, int]] = []
+    for _ in range(count):
+        for _ in range(retries):
+            r = randint(r_min, r_max)
+            cx = randint(r, W - r)
+            cy = randint(r, H - r)
+            gx, gy = cx // cell, cy // cell
+            if all(
+                (cx-x)*(cx-x) + (cy-y)*(cy-y) >= (r+pr)*(r+pr)
+                for i, j in _NEIGHBOUR_CELLS
+                for x, y, pr in grid.get((gx + i, gy + j), ())
+            ):
+                grid.setdefault((gx, gy), []).append((cx, cy, r))
+                placed.append((cx, cy, r))
+                break
+    return placed
+
+
+def _draw_text(d: ImageDraw.ImageDraw, W: int, H: int, name: str, table_label: str,
+               font_path: str, font_size: int | None) -> None:
+    fs = font_size or int(H * 0.25)
+    font = _load_font(font_path, fs)
+    small_font = _load_font(font_path, int(fs * 0.7))
 
-    name_tw, name_th = (lambda b: (b[2]-b[0], b[3]-b[1]))(font.getbbox(name))
-    table_tw, table_th = (lambda b: (b[2]-b[0], b[3]-b[1]))(small_font.getbbox(table_label)) if table_label else (0, 0)
+    name_tw, name_th = _text_size(font, name)
+    table_tw, table_th = _text_size(small_font, table_label) if table_label else (0, 0)
 
     total_height = name_th + (table_th if table_label else 0) + int(H * 0.05)
     name_y = (H - total_height) // 2
@@ -251,6 +303,53 @@ def compose_tag(
     if table_label:
         d.text(((W - table_tw) / 2, table_y), table_label, fill="black", font=small_font)
 
+
+def _compose_plain(
+    name: str,
+    *,
+    font_path: str,
+    size: Tuple[int, int],
+    font_size: int | None = None,
+    table_label: str = "",
+) -> Image.Image:
+    """Fast path: background template plus text, no decorations."""
+    W, H = size
+    img = _background_template(W, H).copy()
+    _draw_text(ImageDraw.Draw(img), W, H, name, table_label, font_path, font_size)
+    return img
+
+
+def _compose_decorated(
+    name: str,
+    *,
+    font_path: str,
+    size: Tuple[int, int],
+    font_size: int | None = None,
+    random_bubbles: bool = False,
+    flowers: bool = False,
+    table_label: str = "",
+) -> Image.Image:
+    W, H = size
+    img = _background_template(W, H).copy()
+    d   = ImageDraw.Draw(img)
+
+    for cx, cy, r in _place_bubbles(W, H):
+        colour = random.choice(PASTELS)
+        if random_bubbles:
+            d.ellipse([(cx - r, cy - r), (cx + r, cy + r)], fill=colour)
+        if flowers:
+            motif = random.choice(("flower", "heart", "wine", "diamond"))
+            if motif == "flower":
+                draw_with_tilt(d, draw_flower, cx, cy, r, colour)
+            elif motif == "heart":
+                draw_with_tilt(d, draw_heart, cx, cy, r, colour)
+            elif motif == "wine":
+                draw_with_tilt(d, draw_wine_glass, cx, cy, r*2, colour)
+            else:
+                draw_with_tilt(d, draw_diamond, cx, cy, r, colour)
+    _draw_border(d, W, H)  # keep the border above the decorations
+
+    _draw_text(d, W, H, name, table_label, font_path, font_size)
     return img
 
 
@@ -259,7 +358,7 @@ def compose_tag(
 # --------------------------------------------------
 
 def build_pdf(
-    paths: List[Path],
+    images: Iterable[bytes],
     out_pdf: Path,
     *,
     cols: int,
@@ -267,7 +366,10 @@ def build_pdf(
     page_size_name: str,
     margin_inch: float,
 ) -> None:
-    """Lay out tag PNGs onto a grid and export a single PDF."""
+    """Lay out JPEG-encoded tags onto a grid and export a single PDF.
+
+    `images` is consumed lazily, so tags can be streamed in as they are rendered.
+    """
     if page_size_name.lower() == "a4":
         PAGE_W, PAGE_H = A4
     else:
@@ -287,28 +389,46 @@ def build_pdf(
     total_per_page = cols * rows
     c = canvas.Canvas(str(out_pdf), pagesize=(PAGE_W, PAGE_H))
 
-    for idx, p in enumerate(paths):
-        page_idx = idx // total_per_page
+    for idx, jpeg in enumerate(images):
         local_idx = idx % total_per_page
+        if local_idx == 0 and idx > 0:
+            c.showPage()
         col = local_idx % cols
         row = local_idx // cols
 
         x = margin + col * (cell_w + col_gap)
         y = PAGE_H - margin - (row + 1) * (cell_h + row_gap) + row_gap
 
-        c.drawImage(str(p), x, y, width=cell_w, height=cell_h, preserveAspectRatio=True, mask='auto')
-
-        if (idx + 1) % total_per_page == 0 and idx + 1 < len(paths):
-            c.showPage()
+        # Tags are fully opaque, so no mask; ReportLab embeds the JPEG as-is.
+        c.drawImage(ImageReader(io.BytesIO(jpeg)), x, y, width=cell_w, height=cell_h, preserveAspectRatio=True, mask=None)
 
     c.save()
 
+# --------------------------------------------------
+# Worker
+# --------------------------------------------------
+
+def _render_one(job: Tuple[str, str, Callable[..., Image.Image], dict, Path | None]) -> Tuple[bytes, Path | None]:
+    """Render a single tag as JPEG bytes, also saving a PNG when `out_dir` is given."""
+    tbl, name, compose_fn, opts, out_dir = job
+    # Seed from the guest rather than the worker so each tag gets the same
+    # layout regardless of which process renders it or in what order.
+    random.seed(f"{tbl}|{name}")
+    img = compose_fn(name, table_label=tbl, **opts)
+    out_path = None
+    if out_dir is not None:
+        out_path = out_dir / f"{sanitize_filename(tbl+'_'+name)}.png"
+        img.save(out_path, "PNG")
+    bio = io.BytesIO()
+    img.save(bio, "JPEG", quality=88)
+    return bio.getvalue(), out_path
+
 # --------------------------------------------------
 # CLI
 # --------------------------------------------------
 
 def main() -> None:
-    ap = argparse.ArgumentParser(description="Generate PNG name tags and bundle them into a compact PDF.")
+    ap = argparse.ArgumentParser(description="Generate name tags as a compact PDF, optionally also saving PNGs.")
     ap.add_argument("input", type=Path, help="Text file with TABLE … / names list")
     ap.add_argument("--font", default="GreatVibes-Regular.ttf", help="Path to .ttf script font")
     ap.add_argument("--font-size", type=int, help="Explicit font size (pt). Default scales to tag.")
@@ -318,6 +438,7 @@ def main() -> None:
     ap.add_argument("--page-size", choices=["letter", "a4"], default="a4", help="PDF page size")
     ap.add_argument("--cols", type=int, default=2, help="Number of columns per page (default 2)")
     ap.add_argument("--margin", type=float, default=0.5, help="Page margin in inches (default 0.5)")
+    ap.add_argument("--keep-pngs", action="store_true", help="Also save each tag as a PNG next to the PDF")
     args = ap.parse_args()
 
     try:
@@ -332,33 +453,37 @@ def main() -> None:
     if not entries:
         raise SystemExit("No names found in input.")
 
-    print("Creating tags …")
-    tag_paths: List[Path] = []
-    for tbl, name in entries:
-        out_path = out_dir / f"{sanitize_filename(tbl+'_'+name)}.png"
-        img = compose_tag(
-            name,
-            font_path=args.font,
-            size=(W, H),
-            font_size=args.font_size,
-            random_bubbles=args.random_bubbles,
-            flowers=args.flowers,
-            table_label=tbl,  # <- this passes the table label
-        )
-        img.save(out_path, "PNG")
-        tag_paths.append(out_path)
-        print("  ✔︎", out_path)
-
+    print("Creating tags and PDF …")
+    opts = dict(font_path=args.font, size=(W, H), font_size=args.font_size)
+    # Pick the compositor once rather than branching per tag.
+    if args.random_bubbles or args.flowers:
+        compose_fn = _compose_decorated
+        opts.update(random_bubbles=args.random_bubbles, flowers=args.flowers)
+    else:
+        compose_fn = _compose_plain
+    png_dir = out_dir if args.keep_pngs else None
+    jobs = [(tbl, name, compose_fn, opts, png_dir) for tbl, name in entries]
+    workers = os.cpu_count() or 1
+    chunksize = max(1, min(8, len(jobs) // (workers * 4)))
     pdf_file = out_dir / "NameTags.pdf"
-    print("Building PDF …")
-    build_pdf(
-        tag_paths,
-        pdf_file,
-        cols=args.cols,
-        tag_size_px=(W, H),
-        page_size_name=args.page_size,
-        margin_inch=args.margin,
-    )
+    with multiprocessing.Pool(workers) as pool:
+        # imap keeps input order so the PDF lists guests as in the text file.
+        results = pool.imap(_render_one, jobs, chunksize=chunksize)
+
+        def tags() -> Iterator[bytes]:
+            for (tbl, name), (jpeg, out_path) in zip(entries, results):
+                print("  ✔︎", out_path or name)
+                yield jpeg
+
+        # Each tag is placed on the PDF as soon as it arrives and then dropped.
+        build_pdf(
+            tags(),
+            pdf_file,
+            cols=args.cols,
+            tag_size_px=(W, H),
+            page_size_name=args.page_size,
+            margin_inch=args.margin,
+        )
 
     print("Done — PDF saved to", pdf_file)
 